@@ -24,14 +24,25 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import functools
 import math
+import mmap
 import os
 import re
 import shlex
+import sys
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Dict, List, Optional, Tuple
+
+try:  # optional: only used by --vectorized
+    import pandas as _pd
+except ImportError:
+    _pd = None
 
 
 @dataclass
@@ -44,6 +55,7 @@ class WorkerState:
     last_timestamp: Optional[datetime] = None
     recent_times: List[float] = field(default_factory=list)  # seconds per case
     status: str = "unknown"  # running, idle, not_started, completed
+    per_worker_gidx: Dict[int, array] = field(default_factory=dict)  # systemd wid (0=unknown) -> gidx seen in this offset log
 
 
 @dataclass
@@ -73,9 +85,18 @@ class JobProgress:
         return 100.0 * self.cases_done / self.total_cases
 
 
+# \w is unicode alnum plus "_", so [^\w.-] keeps exactly alnum and ._- .
+_SANITIZE_RE = re.compile(r"[^\w.-]")
+
+
 def sanitize_for_filename(s: str) -> str:
     # Mirrors rank_boundary_sat_v18.sage behavior: keep alnum and ._- ; replace others with "_".
-    return "".join(c if (c.isalnum() or c in "._-") else "_" for c in str(s))
+    return _SANITIZE_RE.sub("_", str(s))
+
+
+@functools.lru_cache(maxsize=None)
+def _total_cases(dim: int, kdim: int) -> int:
+    return math.comb(dim, kdim)
 
 
 def parse_env_file(path: Path) -> Dict[str, str]:
@@ -119,80 +140,293 @@ def get_n_vertices(graph: str) -> int:
     raise ValueError(f"Unknown graph: {graph} (provide --n)")
 
 
-def parse_state_file(path: Path) -> Optional[int]:
-    # rank_boundary_sat_v18.sage reads int(first_token).
-    if not path.exists():
-        return None
+def scan_state_files(notebook_dir: Path, name_prefix: str) -> Dict[int, int]:
+    """Read all per-offset state files in one directory scan.
+
+    Matches <name_prefix><offset>.txt entries and returns offset -> last
+    DONE gidx, mirroring rank_boundary_sat_v18.sage's int(first_token)
+    read. One scandir replaces an open per offset; files that are empty,
+    malformed, or unreadable are simply absent from the result.
+    """
+    states: Dict[int, int] = {}
     try:
-        text = path.read_text().strip()
-        if not text:
-            return None
-        return int(text.split()[0])
-    except (ValueError, OSError):
-        return None
+        entries = os.scandir(notebook_dir)
+    except OSError:
+        return states
+    with entries:
+        for e in entries:
+            name = e.name
+            if not (name.startswith(name_prefix) and name.endswith(".txt")):
+                continue
+            try:
+                offset = int(name[len(name_prefix):-4])
+            except ValueError:
+                continue
+            try:
+                with open(e.path, "rb") as f:
+                    states[offset] = int(f.read().split(None, 1)[0])
+            except (IndexError, ValueError, OSError):
+                continue
+    return states
+
 
+def tail_lines(path: Path, max_lines: int, _chunk_size: int = 64 * 1024) -> List[bytes]:
+    """Return up to the last max_lines lines of path without reading the whole file.
 
-_DONE_RE = re.compile(
-    r'\[(?P<ts>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:[+-]\d{2}:\d{2})?)\]\s+DONE\s+.*\bgidx=(?P<gidx>\d+)\b.*\bdt=(?P<dt>\d+\.?\d*)s\b'
+    The file is mmap'd and newlines are located backward with rfind over the
+    mapping, so the kernel page cache is the buffer and only the final tail
+    slice is copied out - O(max_lines) bytes instead of the whole log, which
+    matters for multi-MB per-offset logs. Zero-length files (mmap refuses
+    them) fall back to chunked backward reads. Lines are returned as bytes;
+    the log patterns are pure ASCII, so callers decode only the small
+    captured groups instead of every line.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty file or mmap unavailable: read backward in chunks.
+            buf = bytearray()
+            newlines = 0
+            f.seek(0, os.SEEK_END)
+            pos = f.tell()
+            while pos > 0 and newlines <= max_lines:
+                step = min(_chunk_size, pos)
+                pos -= step
+                f.seek(pos)
+                chunk = f.read(step)
+                buf[:0] = chunk
+                newlines += chunk.count(b"\n")
+            return bytes(buf).splitlines()[-max_lines:]
+
+        with mm:
+            pos = len(mm)
+            newlines = 0
+            while pos > 0 and newlines <= max_lines:
+                nl = mm.rfind(b"\n", 0, pos)
+                if nl <= 0:
+                    pos = 0
+                    break
+                newlines += 1
+                pos = nl
+            return mm[pos:].splitlines()[-max_lines:]
+
+
+# One alternation per line instead of a separate regex pass per pattern.
+# Branch order matters: DONE lines dominate and are tried first.
+# Compiled over bytes: tailed lines are never decoded wholesale, only the
+# small captured groups are.
+_TS_PAT = rb'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:[+-]\d{2}:\d{2})?'
+_LINE_RE = re.compile(
+    rb'(?P<done>\[(?P<ts>' + _TS_PAT + rb')\]\s+DONE\s+.*\bgidx=(?P<gidx>\d+)\b.*\bdt=(?P<dt>\d+\.?\d*)s\b)'
+    rb'|(?P<wstart>^\[worker\s+(?P<wid>\d+)\]\s+start\s+offset=\d+\b)'
+    rb'|(?P<wdone>^\[worker\s+\d+\]\s+(?:done|failed)\s+offset=\d+\b)'
 )
-_TS_BRACKET_RE = re.compile(
-    r'\[(?P<ts>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:[+-]\d{2}:\d{2})?)\]'
+
+# str twins of the branches above, for the pandas-vectorized path.
+_DONE_STR_RE = re.compile(
+    r'\[(?P<ts>' + _TS_PAT.decode("ascii") + r')\]\s+DONE\s+.*\bgidx=(?P<gidx>\d+)\b.*\bdt=(?P<dt>\d+\.?\d*)s\b'
 )
-_WORKER_START_RE = re.compile(r'^\[worker\s+(?P<wid>\d+)\]\s+start\s+offset=(?P<off>\d+)\b')
-_WORKER_DONE_RE = re.compile(r'^\[worker\s+(?P<wid>\d+)\]\s+(done|failed)\s+offset=(?P<off>\d+)\b')
+_WSTART_STR_RE = re.compile(r'^\[worker\s+(?P<wid>\d+)\]\s+start\s+offset=\d+\b')
+_WDONE_STR_RE = re.compile(r'^\[worker\s+\d+\]\s+(?:done|failed)\s+offset=\d+\b')
+
+# Timestamp check for the fast DONE parser (fullmatch on the bracketed
+# slice only, far cheaper than running _LINE_RE over the whole line).
+_TS_RE = re.compile(_TS_PAT)
 
 
-def parse_log_times(path: Path, max_lines: int = 2000) -> List[Tuple[datetime, float]]:
-    """Extract (timestamp, duration) from Sage DONE lines in recent log lines."""
-    results: List[Tuple[datetime, float]] = []
-    if not path.exists():
-        return results
+def get_last_activity(path: Path) -> Optional[datetime]:
+    """Last activity for a log, from its mtime.
+
+    sage appends a timestamped line on every START/DONE, so the file mtime
+    tracks the last bracketed timestamp to within a second - one stat()
+    instead of tailing and regex-scanning the log for a single datapoint.
+    """
     try:
-        lines = path.read_text(errors="replace").splitlines()[-max_lines:]
+        return datetime.fromtimestamp(path.stat().st_mtime)
     except OSError:
-        return results
+        return None
+
+
+# DONE durations kept per offset, feeding the AvgDt column and the ETA.
+_RECENT_WINDOW = 50
+
+
+def _is_word_byte(c: int) -> bool:
+    # ASCII \w for the boundary checks below (bytes regex \b semantics).
+    return 48 <= c <= 57 or 65 <= c <= 90 or 97 <= c <= 122 or c == 95
 
-    for line in lines:
-        m = _DONE_RE.search(line)
-        if not m:
-            continue
-        try:
-            ts = datetime.fromisoformat(m.group("ts"))
-            dt = float(m.group("dt"))
-        except ValueError:
-            continue
-        results.append((ts, dt))
-    return results
 
+def _parse_done_fast(b: bytes) -> Optional[Tuple[int, float]]:
+    """Hand-rolled parser for the common DONE line layout.
 
-def get_last_activity(path: Path, max_lines: int = 2000) -> Optional[datetime]:
-    """Return timestamp of last bracketed timestamp line (START or DONE) in the log."""
-    if not path.exists():
+    Returns (gidx, dt) only for lines where it agrees with _LINE_RE's done
+    branch: "[<iso-ts>] DONE ... gidx=<int> ... dt=<float>s" with a valid
+    timestamp, at most one dot in dt, and word boundaries after the
+    numbers. Lines with a repeated " gidx="/" dt=" field are declined as
+    well, because the regex's greedy .* captures the last pair while the
+    scans below would take the first. Anything unusual returns None and
+    falls through to the regex, so malformed lines are skipped rather
+    than raising. Plain find/slice beats the backtracking regex engine on
+    the lines that dominate the tail.
+    """
+    if not b.startswith(b"["):
+        return None
+    rb = b.find(b"]", 1)
+    if rb < 20 or b[rb + 1:rb + 7] != b" DONE ":
+        return None
+    if _TS_RE.fullmatch(b, 1, rb) is None:
+        return None
+    # rb + 6 is the space that closed " DONE ", which doubles as the space
+    # before gidx in the minimal "[ts] DONE gidx=... dt=...s" layout.
+    g = b.find(b" gidx=", rb + 6)
+    if g < 0:
+        return None
+    g += 6
+    ge = g
+    n = len(b)
+    while ge < n and 48 <= b[ge] <= 57:  # ASCII 0-9
+        ge += 1
+    if ge == g or (ge < n and _is_word_byte(b[ge])):
+        return None
+    if b.find(b" gidx=", ge) >= 0:  # repeated field: the greedy regex decides
         return None
+    d = b.find(b" dt=", ge)
+    if d < 0:
+        return None
+    d += 4
+    de = d
+    while de < n and 48 <= b[de] <= 57:
+        de += 1
+    if de == d:  # the regex wants at least one digit before the dot
+        return None
+    if de < n and b[de] == 46:  # at most one '.', then optional digits
+        de += 1
+        while de < n and 48 <= b[de] <= 57:
+            de += 1
+    if b[de:de + 1] != b"s" or (de + 1 < n and _is_word_byte(b[de + 1])):
+        return None
+    if b.find(b" dt=", de) >= 0:  # repeated field: the greedy regex decides
+        return None
+    # The scans above admit only \d+ and \d+\.?\d*, so these cannot raise.
+    return int(b[g:ge]), float(b[d:de])
+
+
+def _scan_lines_vectorized(
+    lines: List[bytes], collect_attribution: bool = True
+) -> Tuple[List[float], Dict[int, array]]:
+    """Vectorized twin of the scan_log line loop, built on pandas.
+
+    One str.extract per pattern over the whole tail instead of a Python-level
+    regex call per line; the "most recent worker start" state is recovered by
+    forward-filling worker ids, with worker done/failed rows resetting to 0.
+    """
+    times: List[float] = []
+    per_worker: Dict[int, array] = {}
+    if not lines:
+        return times, per_worker
+
+    s = _pd.Series(lines).str.decode("utf-8", "replace")
+
+    done = s.str.extract(_DONE_STR_RE)
+    done_mask = done["gidx"].notna()
+    if not done_mask.any():
+        return times, per_worker
+
+    times = done.loc[done_mask, "dt"].iloc[-_RECENT_WINDOW:].astype("float64").tolist()
+
+    if collect_attribution:
+        wid = _pd.to_numeric(s.str.extract(_WSTART_STR_RE)["wid"], errors="coerce")
+        wid[s.str.match(_WDONE_STR_RE)] = 0.0
+        wid = wid.ffill().fillna(0.0)
+
+        gidxs = done.loc[done_mask, "gidx"].astype("int64")
+        wids = wid[done_mask].astype("int64")
+        for w, gidx in zip(wids.to_numpy(), gidxs.to_numpy()):
+            arr = per_worker.get(int(w))
+            if arr is None:
+                arr = per_worker[int(w)] = array("q")
+            arr.append(int(gidx))
+
+    return times, per_worker
+
+
+def scan_log(
+    path: Path, max_lines: int, vectorized: bool = False, collect_attribution: bool = True
+) -> Tuple[List[float], Dict[int, array]]:
+    """Single-pass scan of the tail of one offset log.
+
+    Returns (times, per_worker_gidx):
+      times           - durations (seconds) of the last _RECENT_WINDOW
+                        Sage DONE lines; the line timestamps are never
+                        parsed (last activity comes from the log mtime)
+      per_worker_gidx - systemd worker id (0 = unknown) -> gidx values,
+                        attributing DONE lines to the most recent
+                        "[worker N] start ..." line. Stored as flat
+                        array('q') with duplicates; uniqueness is
+                        resolved once in worker_case_breakdown_from_logs.
+
+    With vectorized=True the pandas path is used when pandas is importable
+    (worthwhile for large --log-max-lines); otherwise the line loop runs.
+    collect_attribution=False skips the per-worker bookkeeping for callers
+    that will not display the breakdown.
+    """
+    # Bounded window: appends past maxlen drop the oldest entry, so a long
+    # tail never materializes a duration list just to be sliced later.
+    times: deque = deque(maxlen=_RECENT_WINDOW)
+    per_worker: Dict[int, array] = {}
+
     try:
-        lines = path.read_text(errors="replace").splitlines()[-max_lines:]
+        lines = tail_lines(path, max_lines)
     except OSError:
-        return None
+        return list(times), per_worker
 
-    for line in reversed(lines):
-        m = _TS_BRACKET_RE.search(line)
-        if not m:
-            continue
-        try:
-            return datetime.fromisoformat(m.group("ts"))
-        except ValueError:
-            continue
-    return None
+    if vectorized and _pd is not None:
+        return _scan_lines_vectorized(lines, collect_attribution)
+
+    current_wid: Optional[int] = None
+
+    # Bind the per-line callables to locals: global and attribute lookups
+    # inside this loop are measurable at large --log-max-lines.
+    parse_done = _parse_done_fast
+    line_search = _LINE_RE.search
+    append_time = times.append
+
+    for line in lines:
+        fast = parse_done(line)
+        if fast is not None:
+            gidx, dt = fast
+        else:
+            m = line_search(line)
+            if not m:
+                continue
+            if not m.group("done"):
+                if m.group("wstart"):
+                    current_wid = int(m.group("wid"))
+                else:  # wdone
+                    # Clear attribution when a job ends (does not change already-seen DONE lines).
+                    current_wid = None
+                continue
+            gidx = int(m.group("gidx"))
+            dt = float(m.group("dt"))
+
+        if collect_attribution:
+            wid = current_wid if current_wid is not None else 0
+            arr = per_worker.get(wid)
+            if arr is None:
+                arr = per_worker[wid] = array("q")
+            arr.append(gidx)
+        append_time(dt)
+
+    return list(times), per_worker
 
 
 def cases_for_offset(offset: int, stride: int, total: int) -> int:
     # Count gidx values handled by this offset: offset, offset+stride, ...
-    count = 0
-    gidx = offset
-    while gidx < total:
-        count += 1
-        gidx += stride
-    return count
+    # Closed form of ceil((total - offset) / stride); O(1) in total_cases.
+    if offset >= total:
+        return 0
+    return (total - offset + stride - 1) // stride
 
 
 def cases_done_for_offset(last_gidx: Optional[int], offset: int, stride: int) -> int:
@@ -210,11 +444,13 @@ def scan_queue_dirs(var_dir: Path, jobset: str) -> Dict[str, int]:
     qdir = var_dir / jobset / "queue"
     counts = {}
     for name in ("pending", "running", "done", "failed"):
-        d = qdir / name
-        if not d.exists():
+        # scandir reports file type from the directory entry, so no
+        # per-file stat; a missing directory just counts as 0.
+        try:
+            with os.scandir(qdir / name) as entries:
+                counts[name] = sum(1 for e in entries if e.name.endswith(".env") and e.is_file())
+        except OSError:
             counts[name] = 0
-            continue
-        counts[name] = len([p for p in d.glob("*.env") if p.is_file()])
     return counts
 
 
@@ -227,10 +463,12 @@ def analyze_job(
     notebook_dir: Path,
     var_dir: Path,
     log_max_lines: int,
+    vectorized: bool = False,
+    collect_attribution: bool = True,
 ) -> JobProgress:
     dim = n_vertices - 1
     kdim = dim - rank
-    total_cases = math.comb(dim, kdim)
+    total_cases = _total_cases(dim, kdim)
 
     progress = JobProgress(
         jobset=jobset,
@@ -245,17 +483,25 @@ def analyze_job(
 
     graph_sanitized = sanitize_for_filename(graph)
 
-    for offset in range(stride):
-        state_file = notebook_dir / f"state_{graph_sanitized}_r{rank}_stride{stride}_off{offset}.txt"
-        log_file = var_dir / jobset / "log" / f"{jobset}_off{offset}.log"
+    # Hoist the pathlib joins out of the per-offset loop; only the offset
+    # number varies, so build names by string concatenation on fixed prefixes.
+    log_prefix = os.path.join(os.fspath(var_dir), jobset, "log", f"{jobset}_off")
+
+    # All state files in one directory scan instead of one open per offset.
+    states = scan_state_files(notebook_dir, f"state_{graph_sanitized}_r{rank}_stride{stride}_off")
+
+    def _analyze_offset(offset: int) -> WorkerState:
+        log_file = Path(f"{log_prefix}{offset}.log")
 
-        last_gidx = parse_state_file(state_file)
+        last_gidx = states.get(offset)
         cases_total = cases_for_offset(offset, stride, total_cases)
         cases_done = cases_done_for_offset(last_gidx, offset, stride)
 
-        times = parse_log_times(log_file, max_lines=log_max_lines)
-        recent_times = [dt for _, dt in times[-50:]]  # last 50 cases (if present)
-        last_ts = get_last_activity(log_file, max_lines=log_max_lines)
+        recent_times, per_worker_gidx = scan_log(
+            log_file, log_max_lines,
+            vectorized=vectorized, collect_attribution=collect_attribution,
+        )
+        last_ts = get_last_activity(log_file)
 
         # Status heuristic:
         if cases_done >= cases_total and cases_total > 0:
@@ -265,7 +511,7 @@ def analyze_job(
         else:
             status = "running"
 
-        worker = WorkerState(
+        return WorkerState(
             offset=offset,
             stride=stride,
             last_gidx=last_gidx,
@@ -274,65 +520,55 @@ def analyze_job(
             last_timestamp=last_ts,
             recent_times=recent_times,
             status=status,
+            per_worker_gidx=per_worker_gidx,
         )
-        progress.workers.append(worker)
+
+    # Each offset touches only its own state and log files, so the reads can
+    # overlap; ex.map preserves offset order in progress.workers. The floor
+    # of 1 keeps stride <= 0 (e.g. STRIDE=0 in the env file) producing the
+    # empty report it always did instead of tripping the executor.
+    with ThreadPoolExecutor(max_workers=max(1, min(stride, 32))) as ex:
+        progress.workers = list(ex.map(_analyze_offset, range(stride)))
 
     return progress
 
 
-def worker_case_breakdown_from_logs(
-    progress: JobProgress,
-    var_dir: Path,
-    log_max_lines: int,
-) -> Tuple[Dict[int, Set[int]], Set[int]]:
+def _unique_count(values: array) -> int:
+    """Number of distinct values, via sort + adjacent-dedup (no per-int set entries)."""
+    if not values:
+        return 0
+    prev = None
+    count = 0
+    for v in sorted(values):
+        if v != prev:
+            count += 1
+            prev = v
+    return count
+
+
+def worker_case_breakdown_from_logs(progress: JobProgress) -> Tuple[Dict[int, int], int]:
     """
-    Best-effort attribution:
-      - Track last seen "[worker N] start ..." in each offset log.
-      - Attribute Sage "[ts] DONE ... gidx=..." lines to that worker id.
+    Best-effort attribution, merged from the per-offset scan_log results
+    already collected by analyze_job (the logs are not re-read).
     Returns:
-      per_worker_gidx: worker_id -> set of gidx values
-      all_gidx: set of all gidx values seen in logs
+      per_worker_counts: worker_id -> number of unique gidx values
+      all_gidx_count: number of unique gidx values seen across all logs
     """
-    per_worker: Dict[int, Set[int]] = {}
-    all_gidx: Set[int] = set()
+    # Completed jobs: state files are canonical and already show 100%, so the
+    # breakdown adds nothing (common when re-running on archived jobsets).
+    if progress.total_cases > 0 and progress.cases_done == progress.total_cases:
+        return {}, 0
 
-    jobset = progress.jobset
-    for w in progress.workers:
-        log_file = var_dir / jobset / "log" / f"{jobset}_off{w.offset}.log"
-        if not log_file.exists():
-            continue
-        try:
-            lines = log_file.read_text(errors="replace").splitlines()[-log_max_lines:]
-        except OSError:
-            continue
+    merged: Dict[int, array] = {}
+    all_gidx = array("q")
 
-        current_wid: Optional[int] = None
-
-        for line in lines:
-            mws = _WORKER_START_RE.match(line)
-            if mws:
-                try:
-                    current_wid = int(mws.group("wid"))
-                except ValueError:
-                    current_wid = None
-                continue
-
-            md = _DONE_RE.search(line)
-            if md:
-                try:
-                    gidx = int(md.group("gidx"))
-                except ValueError:
-                    continue
-                all_gidx.add(gidx)
-                wid = current_wid if current_wid is not None else 0
-                per_worker.setdefault(wid, set()).add(gidx)
-                continue
-
-            # Optional: clear current_wid when job ends (does not change attribution of already-seen DONE lines)
-            if _WORKER_DONE_RE.match(line):
-                current_wid = None
+    for w in progress.workers:
+        for wid, garr in w.per_worker_gidx.items():
+            merged.setdefault(wid, array("q")).extend(garr)
+            all_gidx.extend(garr)
 
-    return per_worker, all_gidx
+    per_worker_counts = {wid: _unique_count(garr) for wid, garr in merged.items()}
+    return per_worker_counts, _unique_count(all_gidx)
 
 
 def format_duration(seconds: float) -> str:
@@ -349,26 +585,27 @@ def format_duration(seconds: float) -> str:
 def print_progress(
     progress: JobProgress,
     queue_counts: Dict[str, int],
-    var_dir: Path,
     show_worker_breakdown: bool,
-    log_max_lines: int,
 ) -> None:
-    print("=" * 80)
-    print(f"Jobset: {progress.jobset}")
-    print(f"Graph:  {progress.graph} (N={progress.n_vertices})")
-    print(f"Rank:   ≤ {progress.rank} (dim={progress.dim}, kdim={progress.kdim})")
-    print(f"Total:  C({progress.dim},{progress.kdim}) = {progress.total_cases}")
-    print(f"Stride: {progress.stride}")
-    print("=" * 80)
+    # Assemble the whole report and write it once: one stdout flush instead
+    # of one per line, and no interleaving when several invocations race.
+    out: List[str] = []
+    out.append("=" * 80)
+    out.append(f"Jobset: {progress.jobset}")
+    out.append(f"Graph:  {progress.graph} (N={progress.n_vertices})")
+    out.append(f"Rank:   ≤ {progress.rank} (dim={progress.dim}, kdim={progress.kdim})")
+    out.append(f"Total:  C({progress.dim},{progress.kdim}) = {progress.total_cases}")
+    out.append(f"Stride: {progress.stride}")
+    out.append("=" * 80)
 
-    print(f"\nQueue: pending={queue_counts['pending']} running={queue_counts['running']} done={queue_counts['done']} failed={queue_counts['failed']}")
+    out.append(f"\nQueue: pending={queue_counts['pending']} running={queue_counts['running']} done={queue_counts['done']} failed={queue_counts['failed']}")
 
-    print(f"\nOverall: {progress.cases_done}/{progress.total_cases} ({progress.pct_complete:.1f}%) | remaining: {progress.cases_remaining}")
+    out.append(f"\nOverall: {progress.cases_done}/{progress.total_cases} ({progress.pct_complete:.1f}%) | remaining: {progress.cases_remaining}")
 
     # Per-offset summary
     header = f"\n{'Off':>3} {'Status':>10} {'Done':>6} {'Total':>6} {'Pct':>6} {'LastGidx':>8} {'AvgDt':>7} {'LastActive':>19}"
-    print(header)
-    print("-" * len(header))
+    out.append(header)
+    out.append("-" * len(header))
 
     all_times: List[float] = []
 
@@ -380,36 +617,39 @@ def print_progress(
         last_gidx_str = str(w.last_gidx) if w.last_gidx is not None else "-"
         avg_dt_str = f"{avg_dt:5.1f}s" if avg_dt is not None else "   -  "
         last_ts_str = w.last_timestamp.isoformat(timespec="seconds") if w.last_timestamp else "-"
-        print(f"{w.offset:3d} {w.status:>10} {w.cases_done:6d} {w.cases_total:6d} {pct:5.1f}% {last_gidx_str:>8} {avg_dt_str:>7} {last_ts_str:>19}")
+        out.append(f"{w.offset:3d} {w.status:>10} {w.cases_done:6d} {w.cases_total:6d} {pct:5.1f}% {last_gidx_str:>8} {avg_dt_str:>7} {last_ts_str:>19}")
 
     # ETA (only if we have dt samples)
     if all_times and progress.cases_remaining > 0:
         avg_time = sum(all_times) / len(all_times)
         max_remaining = max((w.cases_total - w.cases_done) for w in progress.workers)
         eta_seconds = max_remaining * avg_time
-        print(f"\nETA (slowest offset): ~{format_duration(eta_seconds)} (avg {avg_time:.1f}s/case, max_remaining={max_remaining})")
+        out.append(f"\nETA (slowest offset): ~{format_duration(eta_seconds)} (avg {avg_time:.1f}s/case, max_remaining={max_remaining})")
 
-    if show_worker_breakdown:
-        per_worker, all_gidx = worker_case_breakdown_from_logs(progress, var_dir=var_dir, log_max_lines=log_max_lines)
+    if show_worker_breakdown and progress.total_cases > 0 and progress.cases_done == progress.total_cases:
+        out.append("\nWorker breakdown skipped: job complete (state files are canonical).")
+    elif show_worker_breakdown:
+        per_worker_counts, all_gidx_count = worker_case_breakdown_from_logs(progress)
 
         # counts
-        rows = sorted(((wid, len(gset)) for wid, gset in per_worker.items()), key=lambda x: (-x[1], x[0]))
-        print("\nCases completed by systemd worker id (best-effort from logs, unique gidx):")
+        rows = sorted(per_worker_counts.items(), key=lambda x: (-x[1], x[0]))
+        out.append("\nCases completed by systemd worker id (best-effort from logs, unique gidx):")
         if not rows:
-            print("  (no DONE lines found in logs)")
+            out.append("  (no DONE lines found in logs)")
         else:
             for wid, n in rows:
                 label = f"worker {wid}" if wid != 0 else "worker ?"
-                print(f"  {label:8s} {n:4d}  ({100.0*n/progress.total_cases:5.1f}%)")
+                out.append(f"  {label:8s} {n:4d}  ({100.0*n/progress.total_cases:5.1f}%)")
 
         # sanity check
-        if all_gidx:
-            print(f"\nLog-derived unique cases: {len(all_gidx)}/{progress.total_cases}")
-        if all_gidx and len(all_gidx) != progress.cases_done:
-            print("NOTE: state-file progress and log-derived unique gidx differ.")
-            print("      State files are canonical; logs may be truncated or missing DONE lines.")
+        if all_gidx_count:
+            out.append(f"\nLog-derived unique cases: {all_gidx_count}/{progress.total_cases}")
+        if all_gidx_count and all_gidx_count != progress.cases_done:
+            out.append("NOTE: state-file progress and log-derived unique gidx differ.")
+            out.append("      State files are canonical; logs may be truncated or missing DONE lines.")
 
-    print()
+    out.append("")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main() -> None:
@@ -429,6 +669,8 @@ def main() -> None:
 
     ap.add_argument("--no-worker-breakdown", action="store_true", help="Do not attempt per-worker case attribution from logs")
     ap.add_argument("--log-max-lines", type=int, default=2000, help="Max tail lines to read from each log (default: 2000)")
+    ap.add_argument("--vectorized", action="store_true",
+                    help="Parse log tails with pandas (worthwhile for large --log-max-lines; ignored if pandas is not installed)")
 
     args = ap.parse_args()
 
@@ -496,6 +738,8 @@ def main() -> None:
         notebook_dir=notebook_dir,
         var_dir=var_dir,
         log_max_lines=int(args.log_max_lines),
+        vectorized=args.vectorized,
+        collect_attribution=(not args.no_worker_breakdown),
     )
 
     queue_counts = scan_queue_dirs(var_dir, jobset)
@@ -503,9 +747,7 @@ def main() -> None:
     print_progress(
         progress,
         queue_counts,
-        var_dir=var_dir,
         show_worker_breakdown=(not args.no_worker_breakdown),
-        log_max_lines=int(args.log_max_lines),
     )
 
 